@@ -14,10 +14,20 @@ Usage:
 Exit codes:
     0 - All tests valid
     1 - Validation errors found
+
+Results are cached per file content in .cache/validate_tests/, so unchanged
+files are not re-parsed on later runs. The cache key also covers this script's
+own source, so editing the validator invalidates old results. One file is added
+per edited test file and old entries are never pruned; delete the directory to
+reclaim space.
 """
 
 import ast
+import hashlib
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
@@ -27,6 +37,16 @@ REQUIRED_SECTIONS = [
     "Prediction:",
 ]
 
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "validate_tests"
+
+# Below this many uncached files, parsing serially beats starting a process
+# pool (a test file parses in ~1-2 ms, a spawned pool takes ~50-100 ms)
+MIN_PARALLEL_FILES = 32
+
+# The validator's own source is part of every cache key, so any change to the
+# validation logic invalidates previously cached results
+_VALIDATOR_SOURCE = Path(__file__).read_bytes()
+
 
 def validate_test_docstring(func_name: str, docstring: str | None) -> list[str]:
     """
@@ -47,38 +67,90 @@ def validate_test_docstring(func_name: str, docstring: str | None) -> list[str]:
     return errors
 
 
-def validate_test_file(filepath: Path) -> list[str]:
+def _iter_test_defs(tree: ast.Module):
     """
-    Validate all test functions in a file.
+    Yield (lineno, name, docstring) for each test function in a module.
 
-    Returns list of error messages.
+    Covers module-level functions and methods of top-level classes.
     """
-    errors = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
+            yield node.lineno, node.name, ast.get_docstring(node)
+        elif isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef) and item.name.startswith("test_"):
+                    yield item.lineno, item.name, ast.get_docstring(item)
+
 
+def _format_errors(filepath: Path, raw_errors: list) -> list[str]:
+    """Format (lineno, message) pairs as reportable error strings."""
+    return [f"{filepath}:{lineno} - {err}" for lineno, err in raw_errors]
+
+
+def _cache_file(source: str) -> Path:
+    """Return the cache file path for a test file's source."""
+    key = hashlib.sha256(_VALIDATOR_SOURCE + b"\0" + source.encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _check_cache(filepath: Path) -> tuple[tuple[Path, list[str], int] | None, str | None]:
+    """
+    Read a test file and look up its cached validation result.
+
+    Returns (result, source). result is None on a cache miss. source is None
+    when the file could not be read, in which case result holds the error.
+    """
     try:
         source = filepath.read_text()
+    except Exception as e:
+        return (filepath, [f"{filepath}: Failed to parse: {e}"], 0), None
+
+    try:
+        cached = json.loads(_cache_file(source).read_text())
+        return (filepath, _format_errors(filepath, cached["errors"]), cached["count"]), source
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, source
+
+
+def _validate_source(filepath: Path, source: str) -> tuple[Path, list[str], int]:
+    """
+    Parse and validate the source of a test file, then cache the result.
+
+    Returns (filepath, list of error messages, number of test functions checked).
+    """
+    raw_errors = []
+    count = 0
+
+    try:
         tree = ast.parse(source)
     except Exception as e:
-        return [f"{filepath}: Failed to parse: {e}"]
+        return filepath, [f"{filepath}: Failed to parse: {e}"], 0
 
-    for node in ast.walk(tree):
-        # Check functions starting with 'test_'
-        if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
-            docstring = ast.get_docstring(node)
-            func_errors = validate_test_docstring(node.name, docstring)
-            for err in func_errors:
-                errors.append(f"{filepath}:{node.lineno} - {err}")
+    for lineno, name, docstring in _iter_test_defs(tree):
+        count += 1
+        for err in validate_test_docstring(name, docstring):
+            raw_errors.append((lineno, err))
 
-        # Check methods in classes
-        elif isinstance(node, ast.ClassDef):
-            for item in node.body:
-                if isinstance(item, ast.FunctionDef) and item.name.startswith("test_"):
-                    docstring = ast.get_docstring(item)
-                    func_errors = validate_test_docstring(item.name, docstring)
-                    for err in func_errors:
-                        errors.append(f"{filepath}:{item.lineno} - {err}")
+    # Errors are cached without the path so renamed/copied files still hit
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_file(source).write_text(json.dumps({"errors": raw_errors, "count": count}))
+    except OSError:
+        pass
 
-    return errors
+    return filepath, _format_errors(filepath, raw_errors), count
+
+
+def validate_test_file(filepath: Path) -> tuple[Path, list[str], int]:
+    """
+    Validate all test functions in a file, using the cache when possible.
+
+    Returns (filepath, list of error messages, number of test functions checked).
+    """
+    result, source = _check_cache(filepath)
+    if result is not None:
+        return result
+    return _validate_source(filepath, source)
 
 
 def main():
@@ -98,25 +170,40 @@ def main():
     all_errors = []
     validated_count = 0
 
+    existing_files = []
     for filepath in test_files:
         if not filepath.exists():
             all_errors.append(f"{filepath}: File not found")
-            continue
+        else:
+            existing_files.append(filepath)
+
+    # Serve cache hits here, so a fully cached run never starts a process pool
+    results = {}
+    misses = []
+    for filepath in existing_files:
+        result, source = _check_cache(filepath)
+        if result is None:
+            misses.append((filepath, source))
+        else:
+            results[filepath] = result
+
+    # Misses are independent, so parse them in parallel, but only when there
+    # are enough of them to pay for starting the pool
+    max_workers = min(len(misses), (os.cpu_count() or 1) - 2)
+    if max_workers <= 1 or len(misses) < MIN_PARALLEL_FILES:
+        fresh = [_validate_source(filepath, source) for filepath, source in misses]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            fresh = list(executor.map(_validate_source, *zip(*misses)))
+    for result in fresh:
+        results[result[0]] = result
 
-        errors = validate_test_file(filepath)
+    for filepath in existing_files:
+        _, errors, count = results[filepath]
         all_errors.extend(errors)
 
         if not errors:
-            # Count tests in file
-            source = filepath.read_text()
-            tree = ast.parse(source)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
-                    validated_count += 1
-                elif isinstance(node, ast.ClassDef):
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef) and item.name.startswith("test_"):
-                            validated_count += 1
+            validated_count += count
 
     # Report results
     print("=" * 60)
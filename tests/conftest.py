@@ -43,6 +43,7 @@ Example:
 
 import os
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
 import numpy as np
 
@@ -87,6 +88,21 @@ def pytest_collection_modifyitems(config, items):
 # =============================================================================
 # MOCK FACTORIES
 # =============================================================================
+#
+# Data-only objects (properties, channels, signals, device infos) are plain
+# SimpleNamespace/slotted objects, which are much cheaper than Mock. Mock is
+# kept where tests rely on side_effect or call assertions.
+
+class _MockChannel:
+    """Lightweight stand-in for an opendaq Channel."""
+
+    __slots__ = ("name", "global_id", "get_function_blocks")
+
+    def __init__(self, name: str, global_id: str, function_blocks: list):
+        self.name = name
+        self.global_id = global_id
+        self.get_function_blocks = lambda: function_blocks
+
 
 @pytest.fixture
 def mock_property():
@@ -97,12 +113,12 @@ def mock_property():
         prop = mock_property(name="Range", value=0, selection_values=['10', '5', '1'])
     """
     def _create(name: str, value=None, selection_values=None):
-        prop = Mock()
-        prop.name = name
-        prop.value = value
-        prop.selection_values = selection_values
-        prop.unit = None
-        return prop
+        return SimpleNamespace(
+            name=name,
+            value=value,
+            selection_values=selection_values,
+            unit=None,
+        )
     return _create
 
 
@@ -143,11 +159,11 @@ def mock_channel(mock_function_block):
         chan = mock_channel(name="AI 1", function_blocks=[fb])
     """
     def _create(name: str, global_id: str = None, function_blocks: list = None):
-        chan = Mock()
-        chan.name = name
-        chan.global_id = global_id or f"/device/IO/{name}"
-        chan.get_function_blocks.return_value = function_blocks or []
-        return chan
+        return _MockChannel(
+            name=name,
+            global_id=global_id or f"/device/IO/{name}",
+            function_blocks=function_blocks or [],
+        )
     return _create
 
 
@@ -160,10 +176,10 @@ def mock_signal():
         sig = mock_signal(name="AI 1", global_id="/device/sig/AI1")
     """
     def _create(name: str, global_id: str = None):
-        sig = Mock()
-        sig.name = name
-        sig.global_id = global_id or f"/device/sig/{name}"
-        return sig
+        return SimpleNamespace(
+            name=name,
+            global_id=global_id or f"/device/sig/{name}",
+        )
     return _create
 
 
@@ -212,10 +228,7 @@ def mock_device_info():
         info = mock_device_info(name="SiriusX-1", connection_string="daq://...")
     """
     def _create(name: str, connection_string: str):
-        info = Mock()
-        info.name = name
-        info.connection_string = connection_string
-        return info
+        return SimpleNamespace(name=name, connection_string=connection_string)
     return _create
 
 
@@ -0,0 +1,183 @@
+"""
+Unit tests for the result cache in scripts/validate_tests.py.
+
+These tests validate that validate_test_file() serves unchanged files from
+the on-disk cache, falls back to parsing on bad entries, and never reports
+stale results after the validator changes.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import validate_tests
+
+
+SAMPLE_SOURCE = '''
+def test_valid():
+    """
+    Validates: x
+
+    Synthetic Input:
+        - y
+
+    Prediction:
+        z
+    """
+
+
+def test_missing_sections():
+    """Validates: x"""
+'''
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the validator cache at an empty temporary directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setattr(validate_tests, "CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Write SAMPLE_SOURCE to a temporary test file."""
+    path = tmp_path / "test_sample.py"
+    path.write_text(SAMPLE_SOURCE)
+    return path
+
+
+def test_validate_test_file_hit_skips_parse(cache_dir, sample_file, monkeypatch):
+    """
+    Validates: A second run on an unchanged file is served from the cache.
+
+    Synthetic Input:
+        - SAMPLE_SOURCE with one valid and one incomplete test
+        - ast.parse patched to raise after the first run
+
+    Prediction:
+        First run writes one cache entry; second run returns the same
+        result without calling ast.parse.
+    """
+    # Arrange
+    first = validate_tests.validate_test_file(sample_file)
+
+    def fail_parse(source):
+        raise AssertionError("ast.parse called on a cache hit")
+
+    monkeypatch.setattr(validate_tests.ast, "parse", fail_parse)
+
+    # Act
+    second = validate_tests.validate_test_file(sample_file)
+
+    # Assert
+    assert len(list(cache_dir.iterdir())) == 1
+    assert second == first
+    assert first[2] == 2
+    assert len(first[1]) == 2
+
+
+@pytest.mark.parametrize("corruption", ["not json", '{"errors": []}', "[1, 2]"])
+def test_validate_test_file_corrupt_entry_falls_back(cache_dir, sample_file, corruption):
+    """
+    Validates: A corrupt cache entry is ignored and the file is re-parsed.
+
+    Synthetic Input:
+        - Cache entry for SAMPLE_SOURCE overwritten with invalid JSON,
+          a dict missing "count", or a non-dict JSON value
+
+    Prediction:
+        Returns the same result as an uncached run (2 tests, 2 errors)
+        and rewrites the entry with valid content.
+    """
+    # Arrange
+    expected = validate_tests.validate_test_file(sample_file)
+    (entry,) = cache_dir.iterdir()
+    entry.write_text(corruption)
+
+    # Act
+    result = validate_tests.validate_test_file(sample_file)
+
+    # Assert
+    assert result == expected
+    assert json.loads(entry.read_text())["count"] == 2
+
+
+def test_validate_test_file_unreadable_entry_falls_back(cache_dir, sample_file):
+    """
+    Validates: An unreadable cache entry is ignored and the file is re-parsed.
+
+    Synthetic Input:
+        - Cache entry path for SAMPLE_SOURCE occupied by a directory
+
+    Prediction:
+        Returns 2 tests and 2 errors without raising.
+    """
+    # Arrange
+    cache_dir.mkdir()
+    validate_tests._cache_file(SAMPLE_SOURCE).mkdir()
+
+    # Act
+    _, errors, count = validate_tests.validate_test_file(sample_file)
+
+    # Assert
+    assert count == 2
+    assert len(errors) == 2
+
+
+def test_validate_test_file_validator_change_invalidates(cache_dir, sample_file, monkeypatch):
+    """
+    Validates: Changing the validator source invalidates cached results.
+
+    Synthetic Input:
+        - Cache entry for SAMPLE_SOURCE replaced with a stale result
+          {"errors": [], "count": 99}
+        - _VALIDATOR_SOURCE then patched to different bytes
+
+    Prediction:
+        Before the patch the stale count 99 is returned (cache hit);
+        after it the real count 2 is returned.
+    """
+    # Arrange
+    validate_tests.validate_test_file(sample_file)
+    (entry,) = cache_dir.iterdir()
+    entry.write_text(json.dumps({"errors": [], "count": 99}))
+
+    # Act
+    stale = validate_tests.validate_test_file(sample_file)
+    monkeypatch.setattr(validate_tests, "_VALIDATOR_SOURCE", b"changed validator")
+    fresh = validate_tests.validate_test_file(sample_file)
+
+    # Assert
+    assert stale[2] == 99
+    assert fresh[2] == 2
+
+
+def test_validate_test_file_hit_reports_current_path(cache_dir, sample_file, tmp_path):
+    """
+    Validates: Cached errors are reported against the file actually checked.
+
+    Synthetic Input:
+        - SAMPLE_SOURCE validated at test_sample.py
+        - Same content copied to test_copy.py
+
+    Prediction:
+        Copy is a cache hit (no new entry) and every error starts with
+        "<test_copy.py path>:" rather than the original path.
+    """
+    # Arrange
+    validate_tests.validate_test_file(sample_file)
+    copy = tmp_path / "test_copy.py"
+    copy.write_text(SAMPLE_SOURCE)
+
+    # Act
+    filepath, errors, _ = validate_tests.validate_test_file(copy)
+
+    # Assert
+    assert len(list(cache_dir.iterdir())) == 1
+    assert filepath == copy
+    assert errors
+    assert all(err.startswith(f"{copy}:") for err in errors)